@@ -1,19 +1,27 @@
-from flask import Flask, make_response
+import json
+import os
+
+from flask import Flask, Response
+from waitress import serve
 
 app = Flask(__name__)
 
+# The body never changes, so serialize it once at import time
+HELLO_BODY = json.dumps(
+    {
+        'response': 'Hello, World!',
+        'status': 200
+    }
+).encode()
+
 @app.route('/')
 def hello():
-    response = make_response(
-        {
-            'response': 'Hello, World!',
-            'status': 200
-        }
-    )
-    return response
+    return Response(HELLO_BODY, status=200, mimetype='application/json')
 
 if __name__ == '__main__':
     # By default flask is only accessible from localhost.
     # Set this to '0.0.0.0' to make it accessible from any IP address
     # on your network (not recommended for production use)
-    app.run(host='0.0.0.0', debug=True)
+    # Served by waitress rather than the single-threaded debug server,
+    # so requests are handled concurrently across a pool of threads
+    serve(app, host='0.0.0.0', port=int(os.getenv('PORT', 5000)), threads=8)
@@ -477,12 +477,14 @@ def get_leaderboard() -> Response:
 
     Query Parameters:
         - sort (str): The field to sort by ('wins', or 'win_pct'). Default is 'wins'.
+        - limit (int, optional): The maximum number of boxers to return. Default is all of them.
+        - offset (int, optional): The number of top-ranked boxers to skip. Default is 0.
 
     Returns:
         JSON response with a sorted leaderboard of boxers.
 
     Raises:
-        400 error if an invalid sort parameter is provided.
+        400 error if an invalid sort, limit, or offset parameter is provided.
         500 error if there is an issue generating the leaderboard.
 
     """
@@ -499,9 +501,27 @@ def get_leaderboard() -> Response:
                 "message": f"Invalid sort parameter '{sort_by}'. Must be one of: {', '.join(valid_sort_fields)}"
             }), 400)
 
+        limit = request.args.get('limit')
+        offset = request.args.get('offset', '0')
+
+        # isdigit() alone also accepts non-ASCII digits such as '²', which int() rejects
+        if (
+            (limit is not None and not (limit.isascii() and limit.isdigit()))
+            or not (offset.isascii() and offset.isdigit())
+        ):
+            app.logger.warning(f"Invalid pagination parameters: limit={limit}, offset={offset}")
+            return make_response(jsonify({
+                "status": "error",
+                "message": "Invalid pagination parameters: limit and offset must be non-negative integers"
+            }), 400)
+
         app.logger.info(f"Generating leaderboard sorted by '{sort_by}'")
 
-        leaderboard_data = boxers_model.get_leaderboard(sort_by)
+        leaderboard_data = boxers_model.get_leaderboard(
+            sort_by,
+            limit=int(limit) if limit is not None else None,
+            offset=int(offset)
+        )
 
         app.logger.info(f"Leaderboard generated successfully. {len(leaderboard_data)} boxers ranked.")
 
@@ -510,6 +530,14 @@ def get_leaderboard() -> Response:
             "leaderboard": leaderboard_data
         }), 200)
 
+    except ValueError as e:
+        # Raised by the model for pagination values SQLite cannot bind
+        app.logger.warning(f"Invalid pagination parameters: {e}")
+        return make_response(jsonify({
+            "status": "error",
+            "message": str(e)
+        }), 400)
+
     except Exception as e:
         app.logger.error(f"Error generating leaderboard: {e}")
         return make_response(jsonify({
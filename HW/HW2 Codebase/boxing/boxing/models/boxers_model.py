@@ -1,7 +1,11 @@
+from bisect import bisect_right
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
 import logging
 import sqlite3
-from typing import Any, List
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from boxing.utils.sql_utils import get_db_connection
 from boxing.utils.logger import configure_logger
@@ -11,7 +15,80 @@ logger = logging.getLogger(__name__)
 configure_logger(logger)
 
 
-@dataclass
+# Statements live in module-level constants so every call hands sqlite3 the
+# same SQL text and hits the connection's prepared-statement cache
+_SQL_INSERT_BOXER = """
+    INSERT INTO boxers (name, weight, height, reach, age)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+_SQL_DELETE_BOXER = "DELETE FROM boxers WHERE id = ? RETURNING id"
+
+_SQL_GET_BY_ID = """
+    SELECT id, name, weight, height, reach, age
+    FROM boxers WHERE id = ?
+"""
+
+_SQL_GET_BY_NAME = """
+    SELECT id, name, weight, height, reach, age
+    FROM boxers WHERE name = ?
+"""
+
+# weight_class and win_pct are generated columns (see sql/init_db.sql),
+# so the leaderboard rows arrive complete
+_SQL_LEADERBOARD = """
+    SELECT id, name, weight, height, reach, age, weight_class, fights, wins,
+           ROUND(win_pct, 1) AS win_pct
+    FROM boxers
+    WHERE fights > 0
+"""
+
+# Both orderings are served by a partial index, so LIMIT stops the scan after the requested page
+# (a LIMIT of -1 means no limit in SQLite)
+_SQL_LEADERBOARD_WINS = _SQL_LEADERBOARD + " ORDER BY wins DESC LIMIT ? OFFSET ?"
+
+# Sort on the unrounded column so rounding does not merge close percentages
+_SQL_LEADERBOARD_WINPCT = _SQL_LEADERBOARD + " ORDER BY boxers.win_pct DESC LIMIT ? OFFSET ?"
+
+_SQL_UPDATE_STATS = "UPDATE boxers SET fights = fights + 1, wins = wins + ? WHERE id = ? RETURNING id"
+
+_SQL_APPLY_STAT_DELTAS = """
+    WITH deltas(id, fights, wins) AS (VALUES {values})
+    UPDATE boxers
+    SET fights = boxers.fights + deltas.fights,
+        wins = boxers.wins + deltas.wins
+    FROM deltas
+    WHERE boxers.id = deltas.id
+    RETURNING id
+"""
+
+# Three bound parameters per boxer, kept well under SQLite's limit of 999
+_STAT_DELTAS_PER_STATEMENT = 300
+
+# SQLite binds integers as signed 64-bit, so LIMIT and OFFSET cannot go past this
+_SQLITE_MAX_INTEGER = 2**63 - 1
+
+# Leaderboard rows read per pooled-connection checkout while streaming
+_LEADERBOARD_PAGE_SIZE = 500
+
+# One bound parameter per name when looking up which boxers in a failed batch already exist
+_NAMES_PER_LOOKUP = 500
+
+# Lower weight bound of each class, in ascending order
+_WEIGHT_CLASS_CUTOFFS = (125, 133, 166, 203)
+_WEIGHT_CLASS_NAMES = ('FEATHERWEIGHT', 'LIGHTWEIGHT', 'MIDDLEWEIGHT', 'HEAVYWEIGHT')
+
+# Boxers already looked up by name, least recently used first
+_BOXER_CACHE_SIZE = 1024
+_boxer_cache = OrderedDict()
+_boxer_cache_lock = threading.Lock()
+
+# Bumped by every invalidation, so a lookup that raced a delete does not cache the deleted boxer
+_boxer_cache_generation = 0
+
+
+# slots=True drops the per-instance __dict__ (needs Python 3.10+)
+@dataclass(frozen=True, slots=True)
 class Boxer:
     id: int
     name: str
@@ -22,11 +99,17 @@ class Boxer:
     weight_class: str = None
 
     def __post_init__(self):
-        self.weight_class = get_weight_class(self.weight)  # Automatically assign weight class
+        # Frozen, so the derived field has to be set through object.__setattr__
+        object.__setattr__(self, 'weight_class', get_weight_class(self.weight))  # Automatically assign weight class
 
+    @property
+    def fighting_skill(self) -> float:
+        # Arbitrary calculations (a property rather than a field, so it is not serialized)
+        age_modifier = -1 if self.age < 25 else (-2 if self.age > 35 else 0)
+        return (self.weight * len(self.name)) + (self.reach / 10) + age_modifier
 
-def create_boxer(name: str, weight: int, height: int, reach: float, age: int) -> None:
 
+def _validate_boxer(weight: int, height: int, reach: float, age: int) -> None:
     if weight < 125:
         raise ValueError(f"Invalid weight: {weight}. Must be at least 125.")
     if height <= 0:
@@ -36,22 +119,35 @@ def create_boxer(name: str, weight: int, height: int, reach: float, age: int) ->
     if not (18 <= age <= 40):
         raise ValueError(f"Invalid age: {age}. Must be between 18 and 40.")
 
+
+def _invalidate_boxer_cache(name: str = None, boxer_id: int = None) -> None:
+    global _boxer_cache_generation
+
+    with _boxer_cache_lock:
+        _boxer_cache_generation += 1
+        if name is not None:
+            _boxer_cache.pop(name, None)
+        if boxer_id is not None:
+            for cached_name, boxer in list(_boxer_cache.items()):
+                if boxer.id == boxer_id:
+                    del _boxer_cache[cached_name]
+
+
+def create_boxer(name: str, weight: int, height: int, reach: float, age: int) -> None:
+
+    _validate_boxer(weight, height, reach, age)
+
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
 
-            # Check if the boxer already exists (name must be unique)
-            cursor.execute("SELECT 1 FROM boxers WHERE name = ?", (name,))
-            if cursor.fetchone():
-                raise ValueError(f"Boxer with name '{name}' already exists")
-
-            cursor.execute("""
-                INSERT INTO boxers (name, weight, height, reach, age)
-                VALUES (?, ?, ?, ?, ?)
-            """, (name, weight, height, reach, age))
+            # The UNIQUE constraint on name rejects duplicates (IntegrityError below)
+            cursor.execute(_SQL_INSERT_BOXER, (name, weight, height, reach, age))
 
             conn.commit()
 
+        _invalidate_boxer_cache(name=name)
+
     except sqlite3.IntegrityError:
         raise ValueError(f"Boxer with name '{name}' already exists")
 
@@ -59,81 +155,159 @@ def create_boxer(name: str, weight: int, height: int, reach: float, age: int) ->
         raise e
 
 
+def create_boxers_bulk(rows: List[tuple]) -> None:
+    # Validate everything up front so a bad row never leaves a partial import
+    names = []
+    seen = set()
+    for name, weight, height, reach, age in rows:
+        _validate_boxer(weight, height, reach, age)
+        if name in seen:
+            raise ValueError(f"Boxer with name '{name}' appears more than once in the batch")
+        seen.add(name)
+        names.append(name)
+
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+
+            # One transaction for the whole batch; the UNIQUE constraint on
+            # name catches boxers that are already in the table
+            try:
+                cursor.executemany(_SQL_INSERT_BOXER, rows)
+            except sqlite3.IntegrityError:
+                conn.rollback()
+
+                existing = _find_existing_names(cursor, names)
+                if not existing:
+                    raise
+
+                listed = ", ".join(f"'{name}'" for name in existing)
+                raise ValueError(f"Boxers with names {listed} already exist")
+
+            conn.commit()
+
+        for name in names:
+            _invalidate_boxer_cache(name=name)
+
+    except sqlite3.Error as e:
+        raise e
+
+
+def _find_existing_names(cursor: sqlite3.Cursor, names: List[str]) -> List[str]:
+    # Looked up in chunks to stay under SQLite's bound-parameter limit, reported in batch order
+    found = set()
+    for start in range(0, len(names), _NAMES_PER_LOOKUP):
+        chunk = names[start:start + _NAMES_PER_LOOKUP]
+        placeholders = ", ".join("?" * len(chunk))
+        cursor.execute(f"SELECT name FROM boxers WHERE name IN ({placeholders})", chunk)
+        found.update(row[0] for row in cursor.fetchall())
+
+    return [name for name in names if name in found]
+
+
 def delete_boxer(boxer_id: int) -> None:
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
 
-            cursor.execute("SELECT id FROM boxers WHERE id = ?", (boxer_id,))
+            cursor.execute(_SQL_DELETE_BOXER, (boxer_id,))
             if cursor.fetchone() is None:
                 raise ValueError(f"Boxer with ID {boxer_id} not found.")
 
-            cursor.execute("DELETE FROM boxers WHERE id = ?", (boxer_id,))
             conn.commit()
 
+        _invalidate_boxer_cache(boxer_id=boxer_id)
+
     except sqlite3.Error as e:
         raise e
 
 
-def get_leaderboard(sort_by: str = "wins") -> List[dict[str, Any]]:
-    query = """
-        SELECT id, name, weight, height, reach, age, fights, wins,
-               (wins * 1.0 / fights) AS win_pct
-        FROM boxers
-        WHERE fights > 0
-    """
-
-    if sort_by == "win_pct":
-        query += " ORDER BY win_pct DESC"
-    elif sort_by == "wins":
-        query += " ORDER BY wins DESC"
-    else:
-        raise ValueError(f"Invalid sort_by parameter: {sort_by}")
+def get_leaderboard(sort_by: str = "wins", limit: Optional[int] = None, offset: int = 0) -> List[dict[str, Any]]:
+    query, limit, offset = _leaderboard_query(sort_by, limit, offset)
 
     try:
+        # One query on one checkout, so the board is a single consistent read
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(query)
-            rows = cursor.fetchall()
-
-        leaderboard = []
-        for row in rows:
-            boxer = {
-                'id': row[0],
-                'name': row[1],
-                'weight': row[2],
-                'height': row[3],
-                'reach': row[4],
-                'age': row[5],
-                'weight_class': get_weight_class(row[2]),  # Calculate weight class
-                'fights': row[6],
-                'wins': row[7],
-                'win_pct': round(row[8] * 100, 1)  # Convert to percentage
-            }
-            leaderboard.append(boxer)
-
-        return leaderboard
+            cursor.execute(query, (limit, offset))
+
+            # Rows come back as sqlite3.Row, so turn them straight into dicts
+            return [dict(row) for row in cursor.fetchall()]
 
     except sqlite3.Error as e:
         raise e
 
 
+def iter_leaderboard(sort_by: str = "wins", limit: Optional[int] = None, offset: int = 0) -> Iterator[dict[str, Any]]:
+    # Validated here rather than in the generator so bad arguments fail on the call
+    return _stream_leaderboard(*_leaderboard_query(sort_by, limit, offset))
+
+
+def _leaderboard_query(sort_by: str, limit: Optional[int], offset: int) -> Tuple[str, int, int]:
+    if sort_by == "win_pct":
+        query = _SQL_LEADERBOARD_WINPCT
+    elif sort_by == "wins":
+        query = _SQL_LEADERBOARD_WINS
+    else:
+        raise ValueError(f"Invalid sort_by parameter: {sort_by}")
+
+    if limit is None:
+        limit = -1
+    elif not isinstance(limit, int) or limit < 0:
+        raise ValueError(f"Invalid limit: {limit}. Must be a non-negative integer.")
+    elif limit > _SQLITE_MAX_INTEGER:
+        raise ValueError(f"Invalid limit: {limit}. Must be at most {_SQLITE_MAX_INTEGER}.")
+
+    if not isinstance(offset, int) or offset < 0:
+        raise ValueError(f"Invalid offset: {offset}. Must be a non-negative integer.")
+    if offset > _SQLITE_MAX_INTEGER:
+        raise ValueError(f"Invalid offset: {offset}. Must be at most {_SQLITE_MAX_INTEGER}.")
+
+    return query, limit, offset
+
+
+def _stream_leaderboard(query: str, limit: int, offset: int) -> Iterator[dict[str, Any]]:
+    # Each page is read on its own checkout and the connection goes back to the
+    # pool before any row is yielded, so a caller can make other model calls
+    # while iterating (or abandon the generator) without holding a connection.
+    # Pages are separate reads, so writes between pages can shift rows across them;
+    # get_leaderboard reads the whole board in one query instead.
+    remaining = limit  # -1 means no limit
+    while remaining != 0:
+        page_size = _LEADERBOARD_PAGE_SIZE if remaining < 0 else min(remaining, _LEADERBOARD_PAGE_SIZE)
+
+        try:
+            with get_db_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(query, (page_size, offset))
+
+                # Rows come back as sqlite3.Row, so turn them straight into dicts
+                rows = [dict(row) for row in cursor.fetchall()]
+
+        except sqlite3.Error as e:
+            raise e
+
+        yield from rows
+
+        if len(rows) < page_size:
+            return
+
+        offset += page_size
+        if remaining > 0:
+            remaining -= page_size
+
+
 def get_boxer_by_id(boxer_id: int) -> Boxer:
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT id, name, weight, height, reach, age
-                FROM boxers WHERE id = ?
-            """, (boxer_id,))
+            cursor.execute(_SQL_GET_BY_ID, (boxer_id,))
 
             row = cursor.fetchone()
 
             if row:
-                boxer = Boxer(
-                    id=row[0], name=row[1], weight=row[2], height=row[3],
-                    reach=row[4], age=row[5]
-                )
+                # The SELECT names exactly the Boxer fields, so the Row maps straight onto them
+                boxer = Boxer(**row)
                 return boxer
             else:
                 raise ValueError(f"Boxer with ID {boxer_id} not found.")
@@ -143,21 +317,31 @@ def get_boxer_by_id(boxer_id: int) -> Boxer:
 
 
 def get_boxer_by_name(boxer_name: str) -> Boxer:
+    with _boxer_cache_lock:
+        boxer = _boxer_cache.get(boxer_name)
+        if boxer is not None:
+            _boxer_cache.move_to_end(boxer_name)
+            return boxer
+        generation = _boxer_cache_generation
+
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT id, name, weight, height, reach, age
-                FROM boxers WHERE name = ?
-            """, (boxer_name,))
+            cursor.execute(_SQL_GET_BY_NAME, (boxer_name,))
 
             row = cursor.fetchone()
 
             if row:
-                boxer = Boxer(
-                    id=row[0], name=row[1], weight=row[2], height=row[3],
-                    reach=row[4], age=row[5]
-                )
+                # The SELECT names exactly the Boxer fields, so the Row maps straight onto them
+                boxer = Boxer(**row)
+
+                with _boxer_cache_lock:
+                    # Skipped if the cache was invalidated after the row was read
+                    if _boxer_cache_generation == generation:
+                        _boxer_cache[boxer_name] = boxer
+                        if len(_boxer_cache) > _BOXER_CACHE_SIZE:
+                            _boxer_cache.popitem(last=False)
+
                 return boxer
             else:
                 raise ValueError(f"Boxer '{boxer_name}' not found.")
@@ -167,18 +351,10 @@ def get_boxer_by_name(boxer_name: str) -> Boxer:
 
 
 def get_weight_class(weight: int) -> str:
-    if weight >= 203:
-        weight_class = 'HEAVYWEIGHT'
-    elif weight >= 166:
-        weight_class = 'MIDDLEWEIGHT'
-    elif weight >= 133:
-        weight_class = 'LIGHTWEIGHT'
-    elif weight >= 125:
-        weight_class = 'FEATHERWEIGHT'
-    else:
+    if weight < _WEIGHT_CLASS_CUTOFFS[0]:
         raise ValueError(f"Invalid weight: {weight}. Weight must be at least 125.")
 
-    return weight_class
+    return _WEIGHT_CLASS_NAMES[bisect_right(_WEIGHT_CLASS_CUTOFFS, weight) - 1]
 
 
 def update_boxer_stats(boxer_id: int, result: str) -> None:
@@ -189,14 +365,61 @@ def update_boxer_stats(boxer_id: int, result: str) -> None:
         with get_db_connection() as conn:
             cursor = conn.cursor()
 
-            cursor.execute("SELECT id FROM boxers WHERE id = ?", (boxer_id,))
+            # A win adds one to wins as well, a loss only to fights
+            cursor.execute(_SQL_UPDATE_STATS, (1 if result == 'win' else 0, boxer_id))
             if cursor.fetchone() is None:
                 raise ValueError(f"Boxer with ID {boxer_id} not found.")
 
-            if result == 'win':
-                cursor.execute("UPDATE boxers SET fights = fights + 1, wins = wins + 1 WHERE id = ?", (boxer_id,))
-            else:  # result == 'loss'
-                cursor.execute("UPDATE boxers SET fights = fights + 1 WHERE id = ?", (boxer_id,))
+            conn.commit()
+
+    except sqlite3.Error as e:
+        raise e
+
+
+def update_boxer_stats_bulk(results: List[Tuple[int, str]]) -> None:
+    deltas = {}
+    for boxer_id, result in results:
+        if result not in {'win', 'loss'}:
+            raise ValueError(f"Invalid result: {result}. Expected 'win' or 'loss'.")
+
+        fights, wins = deltas.get(boxer_id, (0, 0))
+        deltas[boxer_id] = (fights + 1, wins + (1 if result == 'win' else 0))
+
+    # Every result lands in one statement and one transaction
+    apply_boxer_stat_deltas(deltas)
+
+
+@lru_cache(maxsize=64)
+def _stat_deltas_sql(count: int) -> str:
+    # Build the statement once per batch size so repeated flushes of the same size
+    # reuse one SQL string (and its prepared statement)
+    return _SQL_APPLY_STAT_DELTAS.format(values=", ".join(["(?, ?, ?)"] * count))
+
+
+def apply_boxer_stat_deltas(deltas: Dict[int, Tuple[int, int]]) -> None:
+    # deltas maps boxer ID to (fights to add, wins to add)
+    if not deltas:
+        return
+
+    items = list(deltas.items())
+
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+
+            # All chunks share one transaction, so either every delta lands or none do
+            for start in range(0, len(items), _STAT_DELTAS_PER_STATEMENT):
+                chunk = items[start:start + _STAT_DELTAS_PER_STATEMENT]
+                query = _stat_deltas_sql(len(chunk))
+                params = [value for boxer_id, (fights, wins) in chunk for value in (boxer_id, fights, wins)]
+
+                cursor.execute(query, params)
+                updated = {row[0] for row in cursor.fetchall()}
+
+                if len(updated) != len(chunk):
+                    missing = [boxer_id for boxer_id, _ in chunk if boxer_id not in updated]
+                    conn.rollback()
+                    raise ValueError(f"Boxer with ID {missing[0]} not found.")
 
             conn.commit()
 
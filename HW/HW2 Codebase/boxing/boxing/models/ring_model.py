@@ -1,8 +1,9 @@
+from collections import defaultdict
 import logging
 import math
-from typing import List
+from typing import DefaultDict, List, Optional
 
-from boxing.models.boxers_model import Boxer, update_boxer_stats
+from boxing.models.boxers_model import Boxer, apply_boxer_stat_deltas
 from boxing.utils.logger import configure_logger
 from boxing.utils.api_utils import get_random
 
@@ -12,22 +13,36 @@ configure_logger(logger)
 
 
 class RingModel:
-    def __init__(self):
-        self.ring: List[Boxer] = []
+    # The ring only ever holds two boxers, so keep them in fixed slots
+    __slots__ = ('boxer_1', 'boxer_2', 'auto_flush', '_pending')
+
+    def __init__(self, auto_flush: bool = True):
+        self.boxer_1: Optional[Boxer] = None
+        self.boxer_2: Optional[Boxer] = None
+
+        # With auto_flush off (e.g. a tournament), results accumulate as
+        # boxer ID -> [fights, wins] until flush() writes them in one statement
+        self.auto_flush = auto_flush
+        self._pending: DefaultDict[int, List[int]] = defaultdict(lambda: [0, 0])
 
     def fight(self) -> str:
-        if len(self.ring) < 2:
-            raise ValueError("There must be two boxers to start a fight.")
+        boxer_1, boxer_2 = self.boxer_1, self.boxer_2
 
-        boxer_1, boxer_2 = self.get_boxers()
+        if boxer_2 is None:
+            raise ValueError("There must be two boxers to start a fight.")
 
-        skill_1 = self.get_fighting_skill(boxer_1)
-        skill_2 = self.get_fighting_skill(boxer_2)
+        skill_1 = boxer_1.fighting_skill
+        skill_2 = boxer_2.fighting_skill
 
-        # Compute the absolute skill difference
-        # And normalize using a logistic function for better probability scaling
-        delta = abs(skill_1 - skill_2)
-        normalized_delta = 1 / (1 + math.e ** (-delta))
+        # Compute the signed skill difference
+        # And normalize using a logistic function into the chance that boxer_1 wins
+        # (written in two halves so math.exp never overflows on large deltas)
+        delta = skill_1 - skill_2
+        if delta >= 0:
+            normalized_delta = 1.0 / (1.0 + math.exp(-delta))
+        else:
+            exp_delta = math.exp(delta)
+            normalized_delta = exp_delta / (1.0 + exp_delta)
 
         random_number = get_random()
 
@@ -38,38 +53,64 @@ class RingModel:
             winner = boxer_2
             loser = boxer_1
 
-        update_boxer_stats(winner.id, 'win')
-        update_boxer_stats(loser.id, 'loss')
+        # With auto_flush the fight is written on its own, so a failed write
+        # (e.g. a deleted boxer) only loses this fight and is not retried later
+        deltas = defaultdict(lambda: [0, 0]) if self.auto_flush else self._pending
+
+        deltas[winner.id][0] += 1
+        deltas[winner.id][1] += 1
+        deltas[loser.id][0] += 1
+
+        if self.auto_flush:
+            apply_boxer_stat_deltas({boxer_id: tuple(delta) for boxer_id, delta in deltas.items()})
 
         self.clear_ring()
 
         return winner.name
 
-    def clear_ring(self):
-        if not self.ring:
+    def flush(self):
+        if not self._pending:
             return
-        self.ring.clear()
+
+        pending, self._pending = self._pending, defaultdict(lambda: [0, 0])
+
+        try:
+            apply_boxer_stat_deltas({boxer_id: tuple(delta) for boxer_id, delta in pending.items()})
+        except Exception:
+            # The write is all or nothing, so put every result back rather than
+            # losing the whole tournament to one bad boxer
+            for boxer_id, (fights, wins) in pending.items():
+                self._pending[boxer_id][0] += fights
+                self._pending[boxer_id][1] += wins
+            raise
+
+    def clear_ring(self):
+        self.boxer_1 = None
+        self.boxer_2 = None
 
     def enter_ring(self, boxer: Boxer):
         if not isinstance(boxer, Boxer):
             raise TypeError(f"Invalid type: Expected 'Boxer', got '{type(boxer).__name__}'")
 
-        if len(self.ring) >= 2:
+        if self.boxer_1 is None:
+            self.boxer_1 = boxer
+        elif self.boxer_2 is None:
+            self.boxer_2 = boxer
+        else:
             raise ValueError("Ring is full, cannot add more boxers.")
 
-        self.ring.append(boxer)
+    @property
+    def ring(self) -> List[Boxer]:
+        # Read-only view kept for callers of the old list attribute
+        return self.get_boxers()
 
     def get_boxers(self) -> List[Boxer]:
-        if not self.ring:
-            pass
-        else:
-            pass
-
-        return self.ring
+        # Slots fill in order, so boxer_2 is only set when boxer_1 is
+        if self.boxer_2 is not None:
+            return [self.boxer_1, self.boxer_2]
+        if self.boxer_1 is not None:
+            return [self.boxer_1]
+        return []
 
     def get_fighting_skill(self, boxer: Boxer) -> float:
-        # Arbitrary calculations
-        age_modifier = -1 if boxer.age < 25 else (-2 if boxer.age > 35 else 0)
-        skill = (boxer.weight * len(boxer.name)) + (boxer.reach / 10) + age_modifier
-
-        return skill
+        return boxer.fighting_skill
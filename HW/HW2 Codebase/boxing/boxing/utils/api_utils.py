@@ -1,5 +1,9 @@
+from collections import deque
 import logging
 import os
+import random
+import threading
+import time
 import requests
 
 from boxing.utils.logger import configure_logger
@@ -9,28 +13,69 @@ logger = logging.getLogger(__name__)
 configure_logger(logger)
 
 
+# Numbers are fetched from random.org in batches (num=) and handed out one at a time
 RANDOM_ORG_URL = os.getenv("RANDOM_ORG_URL",
-                           "https://www.random.org/decimal-fractions/?num=1&dec=2&col=1&format=plain&rnd=new")
+                           "https://www.random.org/decimal-fractions/?num=256&dec=2&col=1&format=plain&rnd=new")
 
+_session = requests.Session()
+_buffer = deque()
+_buffer_lock = threading.Lock()
+_fallback = random.SystemRandom()
+
+# After a failed request, random.org is skipped for this many seconds so an
+# outage does not cost every fight a full timeout
+RETRY_AFTER = 60
+_retry_at = 0.0
+
+
+def _fetch_random_batch() -> list:
+    response = _session.get(RANDOM_ORG_URL, timeout=5)
+
+    # Check if the request was successful
+    response.raise_for_status()
+
+    random_number_strs = response.text.split()
 
-def get_random() -> float:
     try:
-        response = requests.get(RANDOM_ORG_URL, timeout=5)
+        random_numbers = [float(value) for value in random_number_strs]
+    except ValueError:
+        raise ValueError(f"Invalid response from random.org: {response.text.strip()}")
 
-        # Check if the request was successful
-        response.raise_for_status()
+    if not random_numbers:
+        raise ValueError(f"Invalid response from random.org: {response.text.strip()}")
 
-        random_number_str = response.text.strip()
+    return random_numbers
 
-        try:
-            random_number = float(random_number_str)
-        except ValueError:
-            raise ValueError(f"Invalid response from random.org: {random_number_str}")
 
-        return random_number
+def get_random() -> float:
+    with _buffer_lock:
+        if _buffer:
+            return _buffer.popleft()
+
+        if time.monotonic() < _retry_at:
+            return round(_fallback.random(), 2)
+
+    # Fetched without holding the lock, so other callers fall back instead of queueing behind the request
+    try:
+        random_numbers = _fetch_random_batch()
 
     except requests.exceptions.Timeout:
-        raise RuntimeError("Request to random.org timed out.")
+        logger.warning(f"Request to random.org timed out, using local randomness for the next {RETRY_AFTER}s.")
+        return _back_off()
 
     except requests.exceptions.RequestException as e:
-        raise RuntimeError(f"Request to random.org failed: {e}")
+        logger.warning(f"Request to random.org failed, using local randomness for the next {RETRY_AFTER}s: {e}")
+        return _back_off()
+
+    with _buffer_lock:
+        _buffer.extend(random_numbers)
+        return _buffer.popleft()
+
+
+def _back_off() -> float:
+    global _retry_at
+
+    with _buffer_lock:
+        _retry_at = time.monotonic() + RETRY_AFTER
+
+    return round(_fallback.random(), 2)
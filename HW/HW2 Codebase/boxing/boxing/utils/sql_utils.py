@@ -1,7 +1,10 @@
+import atexit
 from contextlib import contextmanager
 import logging
 import os
 import sqlite3
+import threading
+import time
 
 from boxing.utils.logger import configure_logger
 
@@ -13,15 +16,32 @@ configure_logger(logger)
 # load the db path from the environment with a default value
 DB_PATH = os.getenv("DB_PATH", "/app/sql/boxing.db")
 
+# Connections are opened lazily (up to POOL_SIZE) and reused for the lifetime
+# of the process instead of being opened and closed around every query
+POOL_SIZE = int(os.getenv("DB_POOL_SIZE", os.cpu_count() or 1))
+
+# Prepared statements kept per connection (sqlite3 defaults to 128)
+STATEMENT_CACHE_SIZE = 256
+
+# Seconds to wait for a free connection before giving up, so a leaked or
+# nested checkout raises instead of hanging forever
+POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 30))
+
+# Idle connections, plus a count of every open one (idle or checked out).
+# _pool_available is notified whenever a connection or free capacity comes back.
+_pool = []
+_pool_lock = threading.Lock()
+_pool_available = threading.Condition(_pool_lock)
+_pool_opened = 0
+
 
 def check_database_connection():
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
 
-        # Execute a simple query to verify the connection is active
-        cursor.execute("SELECT 1;")
-        conn.close()
+            # Execute a simple query to verify the connection is active
+            cursor.execute("SELECT 1;")
 
     except sqlite3.Error as e:
         error_message = f"Database connection error: {e}"
@@ -29,15 +49,12 @@ def check_database_connection():
 
 def check_table_exists(tablename: str):
     try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
 
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-
-        # Use parameterized query to avoid SQL injection
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name=?;", (tablename,))
-        result = cursor.fetchone()
-
-        conn.close()
+            # Use parameterized query to avoid SQL injection
+            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name=?;", (tablename,))
+            result = cursor.fetchone()
 
         if result is None:
             error_message = f"Table '{tablename}' does not exist."
@@ -47,14 +64,88 @@ def check_table_exists(tablename: str):
         error_message = f"Table check error for '{tablename}': {e}"
         raise Exception(error_message) from e
 
+# Per-connection settings, applied once when a connection joins the pool
+_CONNECTION_PRAGMAS = (
+    "PRAGMA foreign_keys=ON;",
+    "PRAGMA journal_mode=WAL;",
+    "PRAGMA synchronous=NORMAL;",
+    "PRAGMA temp_store=MEMORY;",
+    "PRAGMA cache_size=-64000;",
+)
+
+def _configure_conn(conn: sqlite3.Connection):
+    conn.row_factory = sqlite3.Row
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+
+def _open_connection() -> sqlite3.Connection:
+    # Pooled connections are handed to whichever thread checks them out
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE)
+    _configure_conn(conn)
+    return conn
+
+def _acquire_connection() -> sqlite3.Connection:
+    global _pool_opened
+
+    deadline = time.monotonic() + POOL_TIMEOUT
+
+    with _pool_available:
+        # Re-checked after every wake-up: a connection may have been returned,
+        # or a broken one closed, which frees room to open a new one
+        while not _pool and _pool_opened >= POOL_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise sqlite3.OperationalError(f"Timed out after {POOL_TIMEOUT}s waiting for a database connection (pool size {POOL_SIZE}).")
+            _pool_available.wait(remaining)
+
+        if _pool:
+            return _pool.pop()
+
+        # Reserve the slot, then connect outside the lock
+        _pool_opened += 1
+
+    try:
+        return _open_connection()
+    except sqlite3.Error:
+        _discard_connection_slot()
+        raise
+
+def _discard_connection_slot():
+    global _pool_opened
+
+    with _pool_available:
+        _pool_opened -= 1
+        _pool_available.notify()
+
+def _release_connection(conn: sqlite3.Connection):
+    try:
+        # Never hand a half-finished transaction to the next caller
+        if conn.in_transaction:
+            conn.rollback()
+    except sqlite3.Error:
+        conn.close()
+        _discard_connection_slot()
+        return
+
+    with _pool_available:
+        _pool.append(conn)
+        _pool_available.notify()
+
+@atexit.register
+def _close_pool():
+    global _pool_opened
+
+    with _pool_available:
+        while _pool:
+            _pool.pop().close()
+            _pool_opened -= 1
+
 @contextmanager
 def get_db_connection():
-    conn = None
+    conn = _acquire_connection()
     try:
-        conn = sqlite3.connect(DB_PATH)
         yield conn
     except sqlite3.Error as e:
         raise e
     finally:
-        if conn:
-            conn.close()
+        _release_connection(conn)
@@ -1,13 +1,32 @@
 DROP TABLE IF EXISTS boxers;
 CREATE TABLE boxers (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
-    name TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
     weight REAL NOT NULL CHECK (weight > 0),
     height REAL NOT NULL CHECK (height > 0),
     reach REAL CHECK (reach > 0),
     age INTEGER NOT NULL CHECK (age >= 18 AND age <= 40),
     fights INTEGER DEFAULT 0 CHECK (fights >= 0),
-    wins INTEGER DEFAULT 0 CHECK (wins >= 0 AND wins <= fights)  -- Wins cannot exceed fights
+    wins INTEGER DEFAULT 0 CHECK (wins >= 0 AND wins <= fights),  -- Wins cannot exceed fights
+    -- Derived columns read by the leaderboard (same cutoffs as get_weight_class)
+    weight_class TEXT GENERATED ALWAYS AS (
+        CASE
+            WHEN weight >= 203 THEN 'HEAVYWEIGHT'
+            WHEN weight >= 166 THEN 'MIDDLEWEIGHT'
+            WHEN weight >= 133 THEN 'LIGHTWEIGHT'
+            ELSE 'FEATHERWEIGHT'
+        END
+    ) VIRTUAL,
+    win_pct REAL GENERATED ALWAYS AS (
+        CASE WHEN fights = 0 THEN 0 ELSE wins * 100.0 / fights END
+    ) VIRTUAL
 );
 
+-- Enforces unique names and serves name lookups
 CREATE UNIQUE INDEX idx_boxers_name ON boxers(name);
+
+-- Partial index matching the leaderboard predicate (fights > 0 ORDER BY wins DESC)
+CREATE INDEX idx_boxers_leaderboard ON boxers(wins DESC, fights) WHERE fights > 0;
+
+-- Same, for the leaderboard sorted by win percentage
+CREATE INDEX idx_boxers_win_pct ON boxers(win_pct DESC) WHERE fights > 0;
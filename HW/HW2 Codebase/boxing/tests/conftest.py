@@ -0,0 +1,46 @@
+from pathlib import Path
+import sqlite3
+
+import pytest
+
+from boxing.utils import sql_utils
+
+
+INIT_DB_PATH = Path(__file__).resolve().parent.parent / "sql" / "init_db.sql"
+
+
+@pytest.fixture(scope="session")
+def template_db():
+    # The schema script runs once per session; tests get page-level copies of it
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(INIT_DB_PATH.read_text())
+    yield conn
+    conn.close()
+
+@pytest.fixture
+def sqlite_db(template_db):
+    # Fresh in-memory database per test, copied from the template with the backup API
+    conn = sqlite3.connect(":memory:")
+    template_db.backup(conn)
+    conn.row_factory = sqlite3.Row  # Same row type as the pooled connections
+    yield conn
+    conn.close()
+
+@pytest.fixture
+def pooled_db(monkeypatch, tmp_path, template_db):
+    # The real connection pool over a file database copied from the template,
+    # sized small and reset so every test starts with no connections open
+    db_path = tmp_path / "boxing.db"
+    conn = sqlite3.connect(db_path)
+    template_db.backup(conn)
+    conn.close()
+
+    monkeypatch.setattr(sql_utils, "DB_PATH", str(db_path))
+    monkeypatch.setattr(sql_utils, "POOL_SIZE", 2)
+    monkeypatch.setattr(sql_utils, "POOL_TIMEOUT", 0.5)
+    monkeypatch.setattr(sql_utils, "_pool", [])
+    monkeypatch.setattr(sql_utils, "_pool_opened", 0)
+
+    yield sql_utils
+
+    sql_utils._close_pool()
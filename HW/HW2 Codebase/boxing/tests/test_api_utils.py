@@ -0,0 +1,109 @@
+import time
+
+import pytest
+import requests
+
+from boxing.utils import api_utils
+from boxing.utils.api_utils import get_random
+
+
+RANDOM_NUMBERS = [0.42, 0.07, 0.91]
+
+
+@pytest.fixture(autouse=True)
+def empty_buffer(monkeypatch):
+    # Every test starts without numbers left over from a previous batch
+    # and without a backoff window left by a previous failure
+    api_utils._buffer.clear()
+    monkeypatch.setattr(api_utils, "_retry_at", 0.0)
+    yield
+    api_utils._buffer.clear()
+
+@pytest.fixture
+def mock_random_org(mocker):
+    # Patch the session's get call
+    # It returns an object, which we have replaced with a mock object
+    mock_response = mocker.Mock()
+    # We are giving that object a text attribute, one number per line
+    mock_response.text = "\n".join(str(number) for number in RANDOM_NUMBERS) + "\n"
+    mocker.patch.object(api_utils._session, "get", return_value=mock_response)
+    return mock_response
+
+def test_get_random(mock_random_org):
+    """Test retrieving a random number from random.org.
+
+    """
+    result = get_random()
+
+    # Assert that the result is the first mocked random number
+    assert result == RANDOM_NUMBERS[0], f"Expected random number {RANDOM_NUMBERS[0]}, but got {result}"
+
+    # Ensure that the correct URL was called
+    api_utils._session.get.assert_called_once_with(api_utils.RANDOM_ORG_URL, timeout=5)
+
+def test_get_random_uses_batch(mock_random_org):
+    """Test that one request to random.org serves a whole batch of numbers.
+
+    """
+    results = [get_random() for _ in RANDOM_NUMBERS]
+
+    assert results == RANDOM_NUMBERS
+    api_utils._session.get.assert_called_once()
+
+    # The buffer is empty again, so the next call fetches a new batch
+    get_random()
+    assert api_utils._session.get.call_count == 2
+
+def test_get_random_request_failure(mocker):
+    """Test falling back to local randomness when the request to random.org fails.
+
+    """
+    # Simulate a request failure
+    mocker.patch.object(api_utils._session, "get", side_effect=requests.exceptions.RequestException("Connection error"))
+
+    result = get_random()
+
+    assert 0 <= result <= 1, f"Expected a number between 0 and 1, but got {result}"
+
+def test_get_random_timeout(mocker):
+    """Test falling back to local randomness when random.org times out.
+
+    """
+    # Simulate a timeout
+    mocker.patch.object(api_utils._session, "get", side_effect=requests.exceptions.Timeout)
+
+    result = get_random()
+
+    assert 0 <= result <= 1, f"Expected a number between 0 and 1, but got {result}"
+
+def test_get_random_invalid_response(mock_random_org):
+    """Test handling of an invalid response from random.org.
+
+    """
+    # Simulate an invalid response (non-number)
+    mock_random_org.text = "invalid_response"
+
+    with pytest.raises(ValueError, match="Invalid response from random.org: invalid_response"):
+        get_random()
+
+def test_get_random_backs_off_after_failure(mocker):
+    """Test that calls during the backoff window skip random.org entirely.
+
+    """
+    mocker.patch.object(api_utils._session, "get", side_effect=requests.exceptions.Timeout)
+
+    get_random()
+    result = get_random()
+
+    assert 0 <= result <= 1, f"Expected a number between 0 and 1, but got {result}"
+    api_utils._session.get.assert_called_once()
+
+def test_get_random_retries_after_backoff(monkeypatch, mock_random_org):
+    """Test that random.org is tried again once the backoff window has passed.
+
+    """
+    # A window that ended a second ago
+    monkeypatch.setattr(api_utils, "_retry_at", time.monotonic() - 1)
+
+    assert get_random() == RANDOM_NUMBERS[0]
+    api_utils._session.get.assert_called_once()
@@ -0,0 +1,58 @@
+import pytest
+
+from app import app
+
+
+######################################################
+#
+#    Fixtures
+#
+######################################################
+
+
+@pytest.fixture
+def client(pooled_db):
+    """A Flask test client backed by the real pool over a fresh database."""
+    return app.test_client()
+
+
+######################################################
+#
+#    Leaderboard
+#
+######################################################
+
+
+@pytest.mark.parametrize("query", [
+    "",
+    "limit=2",
+    "offset=9223372036854775807",
+])
+def test_leaderboard(client, query):
+    """Test that valid pagination parameters return the leaderboard.
+
+    """
+    response = client.get(f"/api/leaderboard?{query}")
+
+    assert response.status_code == 200
+    assert response.get_json() == {"status": "success", "leaderboard": []}
+
+
+@pytest.mark.parametrize("query", [
+    "sort=age",
+    "limit=-1",
+    "limit=abc",
+    "limit=%C2%B2",
+    "offset=%C2%B2",
+    "limit=9223372036854775808",
+    "offset=99999999999999999999",
+], ids=["sort", "negative", "not_a_number", "superscript_limit", "superscript_offset",
+        "limit_too_large", "offset_too_large"])
+def test_leaderboard_invalid_parameters(client, query):
+    """Test that invalid sort or pagination parameters are rejected with a 400.
+
+    """
+    response = client.get(f"/api/leaderboard?{query}")
+
+    assert response.status_code == 400
+    assert response.get_json()["status"] == "error"
@@ -0,0 +1,689 @@
+from contextlib import contextmanager
+from dataclasses import FrozenInstanceError
+import re
+import sqlite3
+
+import pytest
+
+from boxing.models import boxers_model
+from boxing.models.boxers_model import (
+    Boxer,
+    apply_boxer_stat_deltas,
+    create_boxer,
+    create_boxers_bulk,
+    delete_boxer,
+    get_boxer_by_id,
+    get_boxer_by_name,
+    get_leaderboard,
+    iter_leaderboard,
+    get_weight_class,
+    update_boxer_stats,
+    update_boxer_stats_bulk
+)
+
+######################################################
+#
+#    Fixtures
+#
+######################################################
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+def normalize_whitespace(sql_query: str) -> str:
+    return _WHITESPACE_RE.sub(' ', sql_query).strip()
+
+# Expected statements, normalized once at import rather than in every test
+EXPECTED_INSERT_SQL = normalize_whitespace("""
+    INSERT INTO boxers (name, weight, height, reach, age)
+    VALUES (?, ?, ?, ?, ?)
+""")
+EXPECTED_GET_BY_NAME_SQL = normalize_whitespace("""
+    SELECT id, name, weight, height, reach, age
+    FROM boxers WHERE name = ?
+""")
+EXPECTED_UPDATE_STATS_SQL = normalize_whitespace("UPDATE boxers SET fights = fights + 1, wins = wins + ? WHERE id = ? RETURNING id")
+EXPECTED_TWO_STAT_DELTAS_SQL = normalize_whitespace("""
+    WITH deltas(id, fights, wins) AS (VALUES (?, ?, ?), (?, ?, ?))
+    UPDATE boxers
+    SET fights = boxers.fights + deltas.fights,
+        wins = boxers.wins + deltas.wins
+    FROM deltas
+    WHERE boxers.id = deltas.id
+    RETURNING id
+""")
+
+# Row for "Boxer 1" as returned through sqlite3.Row (read-only in the tests, so shared)
+BOXER_1_ROW = {"id": 1, "name": "Boxer 1", "weight": 150, "height": 70, "reach": 72.5, "age": 28}
+
+# Error messages shared by several tests, compiled once (escaped, so '.' matches literally)
+BOXER_999_NOT_FOUND = re.compile(re.escape("Boxer with ID 999 not found."))
+BOXER_1_EXISTS = re.compile(re.escape("Boxer with name 'Boxer 1' already exists"))
+INVALID_SORT_AGE = re.compile(re.escape("Invalid sort_by parameter: age"))
+INVALID_RESULT_DRAW = re.compile(re.escape("Invalid result: draw. Expected 'win' or 'loss'."))
+
+# Mocking the database connection for tests
+# The mocks and the patch are built once per module; mock_cursor resets them for each test
+@pytest.fixture(scope="module")
+def mock_conn(module_mocker):
+    mock_conn = module_mocker.Mock()
+    mock_conn.cursor.return_value = module_mocker.Mock()
+
+    # Mock the get_db_connection context manager from sql_utils
+    @contextmanager
+    def mock_get_db_connection():
+        yield mock_conn  # Yield the mocked connection object
+
+    module_mocker.patch.object(boxers_model, "get_db_connection", mock_get_db_connection)
+
+    return mock_conn
+
+@pytest.fixture
+def mock_cursor(mock_conn):
+    mock_cursor = mock_conn.cursor.return_value
+
+    # Drop calls, return values and side effects left by the previous test
+    mock_conn.reset_mock()
+    mock_cursor.reset_mock(return_value=True, side_effect=True)
+
+    mock_cursor.fetchone.return_value = None  # Default return for queries
+    mock_cursor.fetchall.return_value = []
+    mock_cursor.commit.return_value = None
+
+    return mock_cursor  # Return the mock cursor so we can set expectations per test
+
+# Real in-memory database (see conftest.py) for tests that check what the SQL does rather than how it is spelled
+@pytest.fixture
+def sqlite_conn(mocker, sqlite_db):
+    @contextmanager
+    def sqlite_get_db_connection():
+        yield sqlite_db
+
+    mocker.patch.object(boxers_model, "get_db_connection", sqlite_get_db_connection)
+
+    return sqlite_db
+
+@pytest.fixture(autouse=True)
+def empty_boxer_cache():
+    # Every test starts without boxers cached by a previous test
+    boxers_model._boxer_cache.clear()
+    yield
+    boxers_model._boxer_cache.clear()
+
+
+######################################################
+#
+#    Add and delete
+#
+######################################################
+
+
+def test_create_boxer(sqlite_conn):
+    """Test creating a new boxer.
+
+    """
+    create_boxer(name="Boxer 1", weight=150, height=70, reach=72.5, age=28)
+
+    rows = sqlite_conn.execute("SELECT name, weight, height, reach, age, fights, wins FROM boxers").fetchall()
+
+    assert [tuple(row) for row in rows] == [("Boxer 1", 150, 70, 72.5, 28, 0, 0)], "Expected one new boxer with no fights."
+
+
+def test_create_boxer_duplicate(mock_cursor):
+    """Test creating a boxer with a name that is already taken.
+
+    """
+    # Simulate that the database will raise an IntegrityError due to a duplicate name
+    mock_cursor.execute.side_effect = sqlite3.IntegrityError("UNIQUE constraint failed: boxers.name")
+
+    with pytest.raises(ValueError, match=BOXER_1_EXISTS):
+        create_boxer(name="Boxer 1", weight=150, height=70, reach=72.5, age=28)
+
+
+def test_create_boxers_bulk(mock_cursor):
+    """Test adding several boxers with one executemany call.
+
+    """
+    rows = [("Boxer 1", 150, 70, 72.5, 28), ("Boxer 2", 180, 72, 74.0, 32)]
+
+    create_boxers_bulk(rows)
+
+    expected_query = EXPECTED_INSERT_SQL
+    actual_query = normalize_whitespace(mock_cursor.executemany.call_args[0][0])
+
+    assert actual_query == expected_query, "The SQL query did not match the expected structure."
+    assert mock_cursor.executemany.call_args[0][1] == rows, "Expected all rows to be passed in one call."
+    mock_cursor.execute.assert_not_called()
+
+
+def test_create_boxers_bulk_invalid_row(mock_cursor):
+    """Test that one invalid row rejects the whole batch before touching the database.
+
+    """
+    rows = [("Boxer 1", 150, 70, 72.5, 28), ("Boxer 2", 180, 72, 74.0, 41)]
+
+    with pytest.raises(ValueError, match="Invalid age: 41. Must be between 18 and 40."):
+        create_boxers_bulk(rows)
+
+    mock_cursor.executemany.assert_not_called()
+
+
+def test_create_boxers_bulk_duplicate_in_batch(mock_cursor):
+    """Test error when the same name appears twice in one batch.
+
+    """
+    rows = [("Boxer 1", 150, 70, 72.5, 28), ("Boxer 1", 180, 72, 74.0, 32)]
+
+    with pytest.raises(ValueError, match="Boxer with name 'Boxer 1' appears more than once in the batch"):
+        create_boxers_bulk(rows)
+
+    mock_cursor.executemany.assert_not_called()
+
+
+def test_create_boxers_bulk_duplicate_in_table(sqlite_conn):
+    """Test that the error names the boxers already in the table and nothing is inserted.
+
+    """
+    create_boxer(name="Boxer 1", weight=150, height=70, reach=72.5, age=28)
+    create_boxer(name="Boxer 3", weight=210, height=74, reach=78.0, age=30)
+
+    rows = [("Boxer 3", 210, 74, 78.0, 30), ("Boxer 2", 180, 72, 74.0, 32), ("Boxer 1", 150, 70, 72.5, 28)]
+
+    with pytest.raises(ValueError, match="Boxers with names 'Boxer 3', 'Boxer 1' already exist"):
+        create_boxers_bulk(rows)
+
+    names = [row[0] for row in sqlite_conn.execute("SELECT name FROM boxers ORDER BY id")]
+    assert names == ["Boxer 1", "Boxer 3"], "Expected the whole batch to be rolled back."
+
+
+def test_delete_boxer(sqlite_conn):
+    """Test deleting a boxer by ID.
+
+    """
+    create_boxer(name="Boxer 1", weight=150, height=70, reach=72.5, age=28)
+    boxer_id = sqlite_conn.execute("SELECT id FROM boxers WHERE name = ?", ("Boxer 1",)).fetchone()[0]
+
+    delete_boxer(boxer_id)
+
+    assert sqlite_conn.execute("SELECT COUNT(*) FROM boxers").fetchone()[0] == 0, "Expected the boxer to be deleted."
+
+
+######################################################
+#
+#    Get boxer
+#
+######################################################
+
+
+def test_get_boxer_by_id(mock_cursor):
+    """Test getting a boxer by ID, built from the named columns of the row.
+
+    """
+    mock_cursor.fetchone.return_value = BOXER_1_ROW
+
+    result = get_boxer_by_id(1)
+
+    assert result == Boxer(1, "Boxer 1", 150, 70, 72.5, 28)
+    assert mock_cursor.execute.call_args[0][1] == (1,), "The SQL query arguments did not match."
+
+
+def test_get_boxer_by_name(mock_cursor):
+    """Test getting a boxer by name.
+
+    """
+    mock_cursor.fetchone.return_value = BOXER_1_ROW
+
+    result = get_boxer_by_name("Boxer 1")
+
+    expected_result = Boxer(1, "Boxer 1", 150, 70, 72.5, 28)
+
+    assert result == expected_result, f"Expected {expected_result}, got {result}"
+
+    expected_query = EXPECTED_GET_BY_NAME_SQL
+    actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
+
+    assert actual_query == expected_query, "The SQL query did not match the expected structure."
+    assert mock_cursor.execute.call_args[0][1] == ("Boxer 1",), "The SQL query arguments did not match."
+
+
+def test_get_boxer_by_name_cached(mock_cursor):
+    """Test that repeated lookups of the same name are served from the cache.
+
+    """
+    mock_cursor.fetchone.return_value = BOXER_1_ROW
+
+    first = get_boxer_by_name("Boxer 1")
+    second = get_boxer_by_name("Boxer 1")
+
+    assert second == first
+    assert mock_cursor.execute.call_count == 1, "Expected the second lookup to skip the database."
+
+
+def test_get_boxer_by_name_after_delete(mock_cursor):
+    """Test that deleting a boxer evicts it from the name cache.
+
+    """
+    mock_cursor.fetchone.return_value = BOXER_1_ROW
+    get_boxer_by_name("Boxer 1")
+
+    delete_boxer(1)
+
+    mock_cursor.fetchone.return_value = None
+    with pytest.raises(ValueError, match="Boxer 'Boxer 1' not found."):
+        get_boxer_by_name("Boxer 1")
+
+
+def test_get_boxer_by_name_deleted_before_cached(sqlite_conn, monkeypatch):
+    """Test that a boxer deleted between the lookup's read and its cache insert is not cached.
+
+    """
+    create_boxer("Boxer 1", 150, 70, 72.5, 28)
+
+    def delete_then_build(**row):
+        # Another request deletes the boxer after its row was read but before it is cached
+        delete_boxer(row['id'])
+        return Boxer(**row)
+
+    monkeypatch.setattr(boxers_model, "Boxer", delete_then_build)
+
+    get_boxer_by_name("Boxer 1")
+
+    with pytest.raises(ValueError, match="Boxer 'Boxer 1' not found."):
+        get_boxer_by_name("Boxer 1")
+
+
+######################################################
+#
+#    Leaderboard
+#
+######################################################
+
+
+# Leaderboard rows (by win percentage) as returned through sqlite3.Row, shared read-only by the tests below
+LEADERBOARD_ROWS = [
+    {'id': 2, 'name': 'Boxer 2', 'weight': 180, 'height': 72, 'reach': 74.0, 'age': 32,
+     'weight_class': 'MIDDLEWEIGHT', 'fights': 3, 'wins': 2, 'win_pct': 66.7},
+    {'id': 1, 'name': 'Boxer 1', 'weight': 150, 'height': 70, 'reach': 72.5, 'age': 28,
+     'weight_class': 'LIGHTWEIGHT', 'fights': 6, 'wins': 3, 'win_pct': 50.0},
+]
+
+
+@pytest.mark.parametrize("sort_by, expected_names", [
+    ("wins", ["Boxer 1", "Boxer 2"]),
+    ("win_pct", ["Boxer 2", "Boxer 1"]),
+])
+def test_get_leaderboard(sqlite_conn, sort_by, expected_names):
+    """Test ranking boxers with at least one fight by wins or by win percentage.
+
+    """
+    create_boxers_bulk([
+        ("Boxer 1", 150, 70, 72.5, 28),
+        ("Boxer 2", 180, 72, 74.0, 32),
+        ("Boxer 3", 210, 74, 78.0, 30),
+    ])
+    # Boxer 1 has more wins, Boxer 2 the better record, and Boxer 3 has not fought yet
+    sqlite_conn.executemany("UPDATE boxers SET fights = ?, wins = ? WHERE name = ?",
+                            [(6, 3, "Boxer 1"), (3, 2, "Boxer 2")])
+
+    result = get_leaderboard(sort_by)
+
+    assert [row['name'] for row in result] == expected_names, f"Unexpected order for sort_by={sort_by}"
+
+    expected_rows = {row['name']: row for row in LEADERBOARD_ROWS}
+
+    assert result == [expected_rows[name] for name in expected_names], f"Expected {expected_rows}, but got {result}"
+
+
+def test_get_leaderboard_limit(mock_cursor):
+    """Test that the limit is passed to the query so only the top rows are read.
+
+    """
+    mock_cursor.fetchall.return_value = LEADERBOARD_ROWS[:1]
+
+    result = get_leaderboard("wins", limit=1)
+
+    assert mock_cursor.execute.call_args[0][1] == (1, 0), "The LIMIT argument did not match."
+    assert [row['name'] for row in result] == ['Boxer 2']
+
+
+def test_get_leaderboard_page(mock_cursor):
+    """Test requesting a later page of the leaderboard.
+
+    """
+    mock_cursor.fetchall.return_value = LEADERBOARD_ROWS[1:]
+
+    result = get_leaderboard("wins", limit=1, offset=1)
+
+    assert mock_cursor.execute.call_args[0][1] == (1, 1), "The LIMIT/OFFSET arguments did not match."
+    assert [row['name'] for row in result] == ['Boxer 1']
+
+
+@pytest.mark.parametrize("limit", [-5, 2.5, "10"])
+def test_get_leaderboard_invalid_limit(mock_cursor, limit):
+    """Test error when the leaderboard limit is not a non-negative integer.
+
+    """
+    with pytest.raises(ValueError, match=f"Invalid limit: {limit}. Must be a non-negative integer."):
+        get_leaderboard("wins", limit=limit)
+
+    mock_cursor.execute.assert_not_called()
+
+
+def test_get_leaderboard_invalid_offset(mock_cursor):
+    """Test error when the leaderboard offset is negative.
+
+    """
+    with pytest.raises(ValueError, match="Invalid offset: -1. Must be a non-negative integer."):
+        get_leaderboard("wins", offset=-1)
+
+    mock_cursor.execute.assert_not_called()
+
+
+@pytest.mark.parametrize("limit, offset", [(2**63, 0), (None, 2**63)])
+def test_get_leaderboard_too_large(mock_cursor, limit, offset):
+    """Test error when the leaderboard limit or offset does not fit a SQLite integer.
+
+    """
+    with pytest.raises(ValueError, match=re.escape(f"Must be at most {2**63 - 1}.")):
+        get_leaderboard("wins", limit=limit, offset=offset)
+
+    mock_cursor.execute.assert_not_called()
+
+
+def test_iter_leaderboard(mock_cursor):
+    """Test that the leaderboard can be consumed one row at a time.
+
+    """
+    mock_cursor.fetchall.return_value = LEADERBOARD_ROWS
+
+    rows = iter_leaderboard()
+
+    # Nothing is queried until the first row is requested
+    mock_cursor.execute.assert_not_called()
+
+    first = next(rows)
+    assert first['name'] == 'Boxer 2'
+    assert [row['name'] for row in rows] == ['Boxer 1']
+
+
+@pytest.fixture
+def pooled_leaderboard(monkeypatch, pooled_db):
+    """Three ranked boxers behind the real pool, with one connection and one row per page."""
+    # Undo the module-wide mock so the model goes through the real pool
+    monkeypatch.setattr(boxers_model, "get_db_connection", pooled_db.get_db_connection)
+    monkeypatch.setattr(pooled_db, "POOL_SIZE", 1)
+    monkeypatch.setattr(boxers_model, "_LEADERBOARD_PAGE_SIZE", 1)
+
+    create_boxers_bulk([
+        ("Boxer 1", 150, 70, 72.5, 28),
+        ("Boxer 2", 180, 72, 74.0, 32),
+        ("Boxer 3", 210, 74, 78.0, 30),
+    ])
+    update_boxer_stats_bulk([(1, "win"), (2, "win"), (2, "win"), (3, "win"), (3, "win"), (3, "win")])
+
+
+def test_iter_leaderboard_model_calls_while_iterating(pooled_leaderboard):
+    """Test that other model calls can run while the leaderboard is being iterated.
+
+    """
+    names = [get_boxer_by_id(row['id']).name for row in iter_leaderboard()]
+
+    assert names == ["Boxer 3", "Boxer 2", "Boxer 1"], "Expected every page to be read, in order."
+
+
+def test_iter_leaderboard_abandoned(pooled_leaderboard):
+    """Test that partly consumed, abandoned leaderboard iterators do not hold connections.
+
+    """
+    abandoned = [iter_leaderboard() for _ in range(2)]
+    for rows in abandoned:
+        next(rows)
+
+    assert get_boxer_by_id(1).name == "Boxer 1"
+
+
+def test_get_leaderboard_write_between_pages(pooled_leaderboard, monkeypatch):
+    """Test that a fight recorded while the board is being read cannot duplicate or drop a boxer.
+
+    """
+    pooled_connection = boxers_model.get_db_connection
+    checkouts = []
+
+    @contextmanager
+    def fight_before_next_checkout():
+        # A second checkout would be a later page, so Boxer 1 jumps to the top before it
+        if checkouts:
+            with pooled_connection() as conn:
+                conn.execute("UPDATE boxers SET fights = fights + 5, wins = wins + 5 WHERE name = 'Boxer 1'")
+                conn.commit()
+        checkouts.append(True)
+
+        with pooled_connection() as conn:
+            yield conn
+
+    monkeypatch.setattr(boxers_model, "get_db_connection", fight_before_next_checkout)
+
+    result = get_leaderboard()
+
+    assert [row['name'] for row in result] == ["Boxer 3", "Boxer 2", "Boxer 1"], "Expected one consistent read."
+    assert len(checkouts) == 1, "Expected the whole board to be read on one checkout."
+
+
+def test_iter_leaderboard_invalid_sort(mock_cursor):
+    """Test that an invalid sort is rejected when the generator is created.
+
+    """
+    with pytest.raises(ValueError, match=INVALID_SORT_AGE):
+        iter_leaderboard("age")
+
+
+def test_get_leaderboard_invalid_sort(mock_cursor):
+    """Test error when sorting the leaderboard by an unknown field.
+
+    """
+    with pytest.raises(ValueError, match=INVALID_SORT_AGE):
+        get_leaderboard("age")
+
+    mock_cursor.execute.assert_not_called()
+
+
+######################################################
+#
+#    Weight class
+#
+######################################################
+
+
+def test_boxer_weight_class_assigned():
+    """Test that a new Boxer gets its weight class on construction.
+
+    """
+    boxer = Boxer(1, "Boxer 1", 210, 74, 78.0, 30)
+
+    assert boxer.weight_class == "HEAVYWEIGHT"
+
+
+def test_boxer_is_immutable():
+    """Test that a Boxer cannot be modified after construction.
+
+    """
+    boxer = Boxer(1, "Boxer 1", 150, 70, 72.5, 28)
+
+    with pytest.raises(FrozenInstanceError):
+        boxer.weight = 210
+
+
+def test_boxer_has_no_instance_dict():
+    """Test that Boxer stores its fields in slots rather than a per-instance dict.
+
+    """
+    boxer = Boxer(1, "Boxer 1", 150, 70, 72.5, 28)
+
+    assert not hasattr(boxer, "__dict__")
+
+
+@pytest.mark.parametrize("weight, expected", [
+    (125, "FEATHERWEIGHT"),
+    (132.9, "FEATHERWEIGHT"),
+    (133, "LIGHTWEIGHT"),
+    (166, "MIDDLEWEIGHT"),
+    (202, "MIDDLEWEIGHT"),
+    (203, "HEAVYWEIGHT"),
+    (300, "HEAVYWEIGHT"),
+])
+def test_get_weight_class(weight, expected):
+    """Test mapping weights to weight classes at and around each boundary.
+
+    """
+    assert get_weight_class(weight) == expected
+
+
+# At and just below every cutoff that get_weight_class uses (nothing lighter than the first is allowed)
+WEIGHT_CLASS_BOUNDARIES = [
+    weight
+    for cutoff in boxers_model._WEIGHT_CLASS_CUTOFFS
+    for weight in (cutoff - 1, cutoff)
+    if weight >= boxers_model._WEIGHT_CLASS_CUTOFFS[0]
+]
+
+
+@pytest.mark.parametrize("weight", WEIGHT_CLASS_BOUNDARIES)
+def test_weight_class_column_matches_get_weight_class(sqlite_db, weight):
+    """Test that the generated weight_class column uses the same cutoffs as get_weight_class.
+
+    """
+    sqlite_db.execute(
+        "INSERT INTO boxers (name, weight, height, reach, age) VALUES (?, ?, ?, ?, ?)",
+        ("Boxer 1", weight, 70, 72.5, 28),
+    )
+
+    (weight_class,) = sqlite_db.execute("SELECT weight_class FROM boxers").fetchone()
+
+    assert weight_class == get_weight_class(weight), f"The column and get_weight_class disagree at {weight}."
+
+
+def test_get_weight_class_invalid():
+    """Test error when the weight is below the lightest class.
+
+    """
+    with pytest.raises(ValueError, match="Invalid weight: 124. Weight must be at least 125."):
+        get_weight_class(124)
+
+
+######################################################
+#
+#    Fight stats
+#
+######################################################
+
+
+@pytest.mark.parametrize("result, wins_delta", [("win", 1), ("loss", 0)])
+def test_update_boxer_stats(mock_cursor, result, wins_delta):
+    """Test updating a boxer's fight stats with a single statement.
+
+    """
+    mock_cursor.fetchone.return_value = (1,)
+
+    update_boxer_stats(1, result)
+
+    expected_query = EXPECTED_UPDATE_STATS_SQL
+    actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
+
+    assert actual_query == expected_query, "The UPDATE query did not match the expected structure."
+    assert mock_cursor.execute.call_count == 1, "Expected no existence check before the UPDATE."
+    assert mock_cursor.execute.call_args[0][1] == (wins_delta, 1), "The UPDATE query arguments did not match."
+
+
+def test_update_boxer_stats_invalid_result(mock_cursor):
+    """Test error when the fight result is neither 'win' nor 'loss'.
+
+    """
+    with pytest.raises(ValueError, match=INVALID_RESULT_DRAW):
+        update_boxer_stats(1, "draw")
+
+
+def test_apply_boxer_stat_deltas(mock_cursor):
+    """Test writing accumulated fight results for several boxers in one statement.
+
+    """
+    mock_cursor.fetchall.return_value = [(1,), (2,)]
+
+    apply_boxer_stat_deltas({1: (3, 2), 2: (3, 1)})
+
+    expected_query = EXPECTED_TWO_STAT_DELTAS_SQL
+    actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
+
+    assert actual_query == expected_query, "The SQL query did not match the expected structure."
+    assert mock_cursor.execute.call_count == 1, "Expected a single statement for all boxers."
+    assert list(mock_cursor.execute.call_args[0][1]) == [1, 3, 2, 2, 3, 1], "The SQL query arguments did not match."
+
+
+def test_apply_boxer_stat_deltas_reuses_sql(mock_cursor):
+    """Test that flushes of the same size send the very same SQL string.
+
+    """
+    mock_cursor.fetchall.return_value = [(1,), (2,)]
+
+    apply_boxer_stat_deltas({1: (1, 1), 2: (1, 0)})
+    apply_boxer_stat_deltas({1: (1, 0), 2: (1, 1)})
+
+    first_query, second_query = (call.args[0] for call in mock_cursor.execute.call_args_list)
+
+    assert first_query is second_query, "Expected the statement text to be built once per batch size."
+
+
+def test_apply_boxer_stat_deltas_empty(mock_cursor):
+    """Test that there is nothing to write when no fights are pending.
+
+    """
+    apply_boxer_stat_deltas({})
+
+    mock_cursor.execute.assert_not_called()
+
+
+def test_update_boxer_stats_bulk(mocker):
+    """Test that a list of results is folded into per-boxer deltas and written once.
+
+    """
+    mock_apply = mocker.patch.object(boxers_model, "apply_boxer_stat_deltas")
+
+    update_boxer_stats_bulk([(1, 'win'), (2, 'loss'), (1, 'loss'), (2, 'win'), (1, 'win')])
+
+    mock_apply.assert_called_once_with({1: (3, 2), 2: (2, 1)})
+
+
+def test_update_boxer_stats_bulk_invalid_result(mocker):
+    """Test that an invalid result rejects the whole batch before touching the database.
+
+    """
+    mock_apply = mocker.patch.object(boxers_model, "apply_boxer_stat_deltas")
+
+    with pytest.raises(ValueError, match=INVALID_RESULT_DRAW):
+        update_boxer_stats_bulk([(1, 'win'), (2, 'draw')])
+
+    mock_apply.assert_not_called()
+
+
+######################################################
+#
+#    Missing boxers
+#
+######################################################
+
+
+@pytest.mark.parametrize("func, args, match", [
+    (delete_boxer, (999,), BOXER_999_NOT_FOUND),
+    (get_boxer_by_id, (999,), BOXER_999_NOT_FOUND),
+    (get_boxer_by_name, ("Nobody",), "Boxer 'Nobody' not found."),
+    (update_boxer_stats, (999, "win"), BOXER_999_NOT_FOUND),
+    (apply_boxer_stat_deltas, ({1: (1, 1), 999: (1, 0)},), BOXER_999_NOT_FOUND),
+], ids=["delete", "get_by_id", "get_by_name", "update_stats", "apply_deltas"])
+def test_boxer_not_found(mock_cursor, func, args, match):
+    """Test error when a lookup or update refers to a boxer that does not exist.
+
+    """
+    # fetchone finds nothing, and multi-row updates only report boxer 1 back
+    mock_cursor.fetchone.return_value = None
+    mock_cursor.fetchall.return_value = [(1,)]
+
+    with pytest.raises(ValueError, match=match):
+        func(*args)
@@ -0,0 +1,221 @@
+import pytest
+
+from boxing.models import ring_model as ring_model_module
+from boxing.models.boxers_model import Boxer
+from boxing.models.ring_model import RingModel
+
+
+@pytest.fixture()
+def ring_model():
+    """Fixture to provide a new instance of RingModel for each test."""
+    return RingModel()
+
+@pytest.fixture
+def mock_apply_boxer_stat_deltas(mocker):
+    """Mock the apply_boxer_stat_deltas function for testing purposes."""
+    return mocker.patch.object(ring_model_module, "apply_boxer_stat_deltas")
+
+"""Fixtures providing sample boxers for the tests (Boxer is frozen, so one instance per session is safe; fighting_skill is still computed on every read)."""
+@pytest.fixture(scope="session")
+def sample_boxer1():
+    return Boxer(1, 'Boxer 1', 150, 70, 72.5, 28)
+
+@pytest.fixture(scope="session")
+def sample_boxer2():
+    return Boxer(2, 'Boxer 2', 180, 72, 74.0, 32)
+
+
+##################################################
+# Ring Management Test Cases
+##################################################
+
+
+def test_enter_ring(ring_model, sample_boxer1, sample_boxer2):
+    """Test boxers entering the ring in order.
+
+    """
+    ring_model.enter_ring(sample_boxer1)
+    assert ring_model.get_boxers() == [sample_boxer1]
+
+    ring_model.enter_ring(sample_boxer2)
+    assert ring_model.get_boxers() == [sample_boxer1, sample_boxer2]
+
+
+def test_enter_ring_full(ring_model, sample_boxer1, sample_boxer2):
+    """Test error when a third boxer tries to enter the ring.
+
+    """
+    ring_model.enter_ring(sample_boxer1)
+    ring_model.enter_ring(sample_boxer2)
+
+    with pytest.raises(ValueError, match="Ring is full, cannot add more boxers."):
+        ring_model.enter_ring(Boxer(3, 'Boxer 3', 200, 74, 76.0, 30))
+
+
+def test_enter_ring_bad_type(ring_model):
+    """Test error when something other than a Boxer enters the ring.
+
+    """
+    with pytest.raises(TypeError, match="Invalid type: Expected 'Boxer', got 'dict'"):
+        ring_model.enter_ring({'id': 1, 'name': 'Boxer 1'})
+
+
+def test_clear_ring(ring_model, sample_boxer1, sample_boxer2):
+    """Test clearing the ring.
+
+    """
+    ring_model.enter_ring(sample_boxer1)
+    ring_model.enter_ring(sample_boxer2)
+
+    ring_model.clear_ring()
+
+    assert ring_model.get_boxers() == []
+
+
+def test_ring_property(ring_model, sample_boxer1):
+    """Test that the ring property mirrors get_boxers and cannot be assigned.
+
+    """
+    assert ring_model.ring == []
+
+    ring_model.enter_ring(sample_boxer1)
+    assert ring_model.ring == [sample_boxer1]
+
+    with pytest.raises(AttributeError):
+        ring_model.ring = []
+
+
+##################################################
+# Fight Test Cases
+##################################################
+
+
+@pytest.mark.parametrize("order", [(0, 1), (1, 0)])
+def test_fight_stronger_boxer_favored(mocker, ring_model, sample_boxer1, sample_boxer2, mock_apply_boxer_stat_deltas, order):
+    """Test that the stronger boxer is favored no matter which one entered the ring first.
+
+    """
+    mocker.patch.object(ring_model_module, "get_random", return_value=0.5)
+
+    boxers = (sample_boxer1, sample_boxer2)
+    for index in order:
+        ring_model.enter_ring(boxers[index])
+
+    winner = ring_model.fight()
+
+    assert winner == 'Boxer 2', "Expected the heavier, more skilled boxer to win"
+    mock_apply_boxer_stat_deltas.assert_called_once_with({2: (1, 1), 1: (1, 0)})
+    assert ring_model.get_boxers() == [], "Expected the ring to be cleared after the fight"
+
+
+def test_fight_large_skill_gap(mocker, ring_model, sample_boxer1, mock_apply_boxer_stat_deltas):
+    """Test that a very large skill gap does not overflow the win probability.
+
+    """
+    mocker.patch.object(ring_model_module, "get_random", return_value=0.99)
+
+    ring_model.enter_ring(sample_boxer1)
+    ring_model.enter_ring(Boxer(3, 'A Much Longer Boxer Name', 300, 80, 80.0, 30))
+
+    assert ring_model.fight() == 'A Much Longer Boxer Name'
+
+
+def test_fight_not_enough_boxers(ring_model, sample_boxer1):
+    """Test error when starting a fight with fewer than two boxers.
+
+    """
+    ring_model.enter_ring(sample_boxer1)
+
+    with pytest.raises(ValueError, match="There must be two boxers to start a fight."):
+        ring_model.fight()
+
+
+def test_fight_deferred_flush(mocker, ring_model, sample_boxer1, sample_boxer2, mock_apply_boxer_stat_deltas):
+    """Test that with auto_flush off, results from several fights are written in one flush.
+
+    """
+    mocker.patch.object(ring_model_module, "get_random", return_value=0.5)
+    ring_model = RingModel(auto_flush=False)
+
+    for _ in range(3):
+        ring_model.enter_ring(sample_boxer1)
+        ring_model.enter_ring(sample_boxer2)
+        ring_model.fight()
+
+    mock_apply_boxer_stat_deltas.assert_not_called()
+
+    ring_model.flush()
+    mock_apply_boxer_stat_deltas.assert_called_once_with({2: (3, 3), 1: (3, 0)})
+
+    # Nothing is left to write after a flush
+    ring_model.flush()
+    mock_apply_boxer_stat_deltas.assert_called_once()
+
+
+def test_flush_failure_keeps_results(mocker, ring_model, sample_boxer1, sample_boxer2, mock_apply_boxer_stat_deltas):
+    """Test that a failed flush keeps every pending result so it can be written later.
+
+    """
+    mocker.patch.object(ring_model_module, "get_random", return_value=0.5)
+    ring_model = RingModel(auto_flush=False)
+
+    for _ in range(2):
+        ring_model.enter_ring(sample_boxer1)
+        ring_model.enter_ring(sample_boxer2)
+        ring_model.fight()
+
+    mock_apply_boxer_stat_deltas.side_effect = ValueError("Boxer with ID 1 not found.")
+    with pytest.raises(ValueError, match="Boxer with ID 1 not found."):
+        ring_model.flush()
+
+    mock_apply_boxer_stat_deltas.side_effect = None
+    ring_model.flush()
+
+    mock_apply_boxer_stat_deltas.assert_called_with({2: (2, 2), 1: (2, 0)})
+
+
+def test_fight_write_failure_not_retried(mocker, ring_model, sample_boxer1, sample_boxer2, mock_apply_boxer_stat_deltas):
+    """Test that with auto_flush, a fight whose write failed is not written again by the next fight.
+
+    """
+    mocker.patch.object(ring_model_module, "get_random", return_value=0.5)
+
+    mock_apply_boxer_stat_deltas.side_effect = ValueError("Boxer with ID 1 not found.")
+    ring_model.enter_ring(sample_boxer1)
+    ring_model.enter_ring(sample_boxer2)
+    with pytest.raises(ValueError, match="Boxer with ID 1 not found."):
+        ring_model.fight()
+
+    mock_apply_boxer_stat_deltas.side_effect = None
+    ring_model.clear_ring()
+    ring_model.enter_ring(sample_boxer1)
+    ring_model.enter_ring(sample_boxer2)
+    ring_model.fight()
+
+    mock_apply_boxer_stat_deltas.assert_called_with({2: (1, 1), 1: (1, 0)})
+
+
+##################################################
+# Fighting Skill Test Cases
+##################################################
+
+
+@pytest.mark.parametrize("age, expected_skill", [
+    (22, (150 * 7) + 7.25 - 1),
+    (28, (150 * 7) + 7.25),
+    (38, (150 * 7) + 7.25 - 2),
+])
+def test_get_fighting_skill(ring_model, age, expected_skill):
+    """Test the fighting skill formula, including the age modifier.
+
+    """
+    boxer = Boxer(1, 'Boxer 1', 150, 70, 72.5, age)
+
+    assert ring_model.get_fighting_skill(boxer) == pytest.approx(expected_skill)
+
+
+def test_fighting_skill_matches_ring(ring_model, sample_boxer1):
+    """Test that the ring reports the same skill as the boxer itself.
+
+    """
+    assert ring_model.get_fighting_skill(sample_boxer1) == sample_boxer1.fighting_skill
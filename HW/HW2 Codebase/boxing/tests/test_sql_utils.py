@@ -0,0 +1,113 @@
+import sqlite3
+import threading
+
+import pytest
+
+from boxing.utils import sql_utils
+from boxing.utils.sql_utils import get_db_connection
+
+
+######################################################
+#
+#    Connection pool
+#
+######################################################
+
+
+def test_connections_opened_lazily(pooled_db):
+    """Test that connections are opened only when needed, up to POOL_SIZE.
+
+    """
+    assert sql_utils._pool_opened == 0, "Expected no connection before the first checkout."
+
+    first = sql_utils._acquire_connection()
+    assert sql_utils._pool_opened == 1
+
+    second = sql_utils._acquire_connection()
+    assert sql_utils._pool_opened == 2
+    assert second is not first
+
+    assert first.row_factory is sqlite3.Row, "Expected pooled connections to return sqlite3.Row."
+
+    sql_utils._release_connection(first)
+    sql_utils._release_connection(second)
+
+
+def test_connection_reused(pooled_db):
+    """Test that a released connection is handed out again instead of opening a new one.
+
+    """
+    with get_db_connection() as first:
+        pass
+
+    with get_db_connection() as second:
+        pass
+
+    assert second is first
+    assert sql_utils._pool_opened == 1
+
+
+def test_release_rolls_back(pooled_db):
+    """Test that an uncommitted transaction is rolled back when the connection is released.
+
+    """
+    with get_db_connection() as conn:
+        conn.execute("INSERT INTO boxers (name, weight, height, reach, age) VALUES ('Boxer 1', 150, 70, 72.5, 28)")
+        assert conn.in_transaction
+
+    with get_db_connection() as conn:
+        assert not conn.in_transaction, "Expected the next caller to get a clean connection."
+        assert conn.execute("SELECT COUNT(*) FROM boxers").fetchone()[0] == 0
+
+
+def test_exhausted_pool_times_out(pooled_db):
+    """Test that waiting on an exhausted pool raises instead of hanging.
+
+    """
+    held = [sql_utils._acquire_connection() for _ in range(sql_utils.POOL_SIZE)]
+
+    with pytest.raises(sqlite3.OperationalError, match="Timed out after 0.5s waiting for a database connection"):
+        sql_utils._acquire_connection()
+
+    for conn in held:
+        sql_utils._release_connection(conn)
+
+
+def test_exhausted_pool_waits_for_release(pooled_db):
+    """Test that a caller waiting on an exhausted pool gets the next connection released.
+
+    """
+    held = [sql_utils._acquire_connection() for _ in range(sql_utils.POOL_SIZE)]
+
+    threading.Timer(0.05, sql_utils._release_connection, args=(held[0],)).start()
+
+    conn = sql_utils._acquire_connection()
+
+    assert conn is held[0]
+    assert sql_utils._pool_opened == sql_utils.POOL_SIZE
+
+    for conn in held:
+        sql_utils._release_connection(conn)
+
+
+def test_broken_connection_frees_capacity(mocker, pooled_db):
+    """Test that closing a connection whose rollback failed wakes a waiting caller.
+
+    """
+    held = [sql_utils._acquire_connection() for _ in range(sql_utils.POOL_SIZE)]
+
+    # Stands in for held[1] failing its rollback on release
+    broken = mocker.Mock(in_transaction=True)
+    broken.rollback.side_effect = sqlite3.OperationalError("disk I/O error")
+    held[1].close()
+
+    threading.Timer(0.05, sql_utils._release_connection, args=(broken,)).start()
+
+    conn = sql_utils._acquire_connection()
+
+    broken.close.assert_called_once()
+    assert conn is not held[0] and conn is not held[1], "Expected a newly opened connection."
+    assert sql_utils._pool_opened == sql_utils.POOL_SIZE
+
+    sql_utils._release_connection(held[0])
+    sql_utils._release_connection(conn)
@@ -21,8 +21,32 @@ from playlist.models.song_model import (
 #
 ######################################################
 
+_WHITESPACE_RE = re.compile(r'\s+')
+
 def normalize_whitespace(sql_query: str) -> str:
-    return re.sub(r'\s+', ' ', sql_query).strip()
+    return _WHITESPACE_RE.sub(' ', sql_query).strip()
+
+# Expected statements, normalized once at import rather than in every test
+EXPECTED_INSERT_SQL = normalize_whitespace("""
+    INSERT INTO songs (artist, title, year, genre, duration)
+    VALUES (?, ?, ?, ?, ?)
+""")
+EXPECTED_SELECT_ID_SQL = normalize_whitespace("SELECT id FROM songs WHERE id = ?")
+EXPECTED_DELETE_SQL = normalize_whitespace("DELETE FROM songs WHERE id = ?")
+EXPECTED_GET_BY_ID_SQL = normalize_whitespace("SELECT id, artist, title, year, genre, duration FROM songs WHERE id = ?")
+EXPECTED_GET_BY_COMPOUND_KEY_SQL = normalize_whitespace("SELECT id, artist, title, year, genre, duration FROM songs WHERE artist = ? AND title = ? AND year = ?")
+EXPECTED_ALL_SONGS_SQL = normalize_whitespace("""
+    SELECT id, artist, title, year, genre, duration, play_count
+    FROM songs
+""")
+EXPECTED_ALL_SONGS_BY_PLAY_COUNT_SQL = normalize_whitespace("""
+    SELECT id, artist, title, year, genre, duration, play_count
+    FROM songs
+    ORDER BY play_count DESC
+""")
+EXPECTED_UPDATE_PLAY_COUNT_SQL = normalize_whitespace("""
+    UPDATE songs SET play_count = play_count + 1 WHERE id = ?
+""")
 
 # Mocking the database connection for tests
 @pytest.fixture
@@ -59,10 +83,7 @@ def test_create_song(mock_cursor):
     """
     create_song(artist="Artist Name", title="Song Title", year=2022, genre="Pop", duration=180)
 
-    expected_query = normalize_whitespace("""
-        INSERT INTO songs (artist, title, year, genre, duration)
-        VALUES (?, ?, ?, ?, ?)
-    """)
+    expected_query = EXPECTED_INSERT_SQL
     actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
 
     assert actual_query == expected_query, "The SQL query did not match the expected structure."
@@ -117,12 +138,16 @@ def test_delete_song(mock_cursor):
 
     delete_song(1)
 
-    expected_select_sql = normalize_whitespace("SELECT id FROM songs WHERE id = ?")
-    expected_delete_sql = normalize_whitespace("DELETE FROM songs WHERE id = ?")
+    expected_select_sql = EXPECTED_SELECT_ID_SQL
+    expected_delete_sql = EXPECTED_DELETE_SQL
+
+    # Unpack the (sql, args) of both calls to `execute()` from `call_args_list`
+    (select_sql, actual_select_args), (delete_sql, actual_delete_args) = (
+        call.args for call in mock_cursor.execute.call_args_list
+    )
 
-    # Access both calls to `execute()` using `call_args_list`
-    actual_select_sql = normalize_whitespace(mock_cursor.execute.call_args_list[0][0][0])
-    actual_delete_sql = normalize_whitespace(mock_cursor.execute.call_args_list[1][0][0])
+    actual_select_sql = normalize_whitespace(select_sql)
+    actual_delete_sql = normalize_whitespace(delete_sql)
 
     assert actual_select_sql == expected_select_sql, "The SELECT query did not match the expected structure."
     assert actual_delete_sql == expected_delete_sql, "The UPDATE query did not match the expected structure."
@@ -131,9 +156,6 @@ def test_delete_song(mock_cursor):
     expected_select_args = (1,)
     expected_delete_args = (1,)
 
-    actual_select_args = mock_cursor.execute.call_args_list[0][0][1]
-    actual_delete_args = mock_cursor.execute.call_args_list[1][0][1]
-
     assert actual_select_args == expected_select_args, f"The SELECT query arguments did not match. Expected {expected_select_args}, got {actual_select_args}."
     assert actual_delete_args == expected_delete_args, f"The UPDATE query arguments did not match. Expected {expected_delete_args}, got {actual_delete_args}."
 
@@ -168,7 +190,7 @@ def test_get_song_by_id(mock_cursor):
 
     assert result == expected_result, f"Expected {expected_result}, got {result}"
 
-    expected_query = normalize_whitespace("SELECT id, artist, title, year, genre, duration FROM songs WHERE id = ?")
+    expected_query = EXPECTED_GET_BY_ID_SQL
     actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
 
     assert actual_query == expected_query, "The SQL query did not match the expected structure."
@@ -201,7 +223,7 @@ def test_get_song_by_compound_key(mock_cursor):
 
     assert result == expected_result, f"Expected {expected_result}, got {result}"
 
-    expected_query = normalize_whitespace("SELECT id, artist, title, year, genre, duration FROM songs WHERE artist = ? AND title = ? AND year = ?")
+    expected_query = EXPECTED_GET_BY_COMPOUND_KEY_SQL
     actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
 
     assert actual_query == expected_query, "The SQL query did not match the expected structure."
@@ -242,10 +264,7 @@ def test_get_all_songs(mock_cursor):
 
     assert songs == expected_result, f"Expected {expected_result}, but got {songs}"
 
-    expected_query = normalize_whitespace("""
-        SELECT id, artist, title, year, genre, duration, play_count
-        FROM songs
-    """)
+    expected_query = EXPECTED_ALL_SONGS_SQL
     actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
 
     assert actual_query == expected_query, "The SQL query did not match the expected structure."
@@ -263,7 +282,7 @@ def test_get_all_songs_empty_catalog(mock_cursor, caplog):
 
     assert "The song catalog is empty." in caplog.text, "Expected warning about empty catalog not found in logs."
 
-    expected_query = normalize_whitespace("SELECT id, artist, title, year, genre, duration, play_count FROM songs")
+    expected_query = EXPECTED_ALL_SONGS_SQL
     actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
 
     assert actual_query == expected_query, "The SQL query did not match the expected structure."
@@ -289,11 +308,7 @@ def test_get_all_songs_ordered_by_play_count(mock_cursor):
 
     assert songs == expected_result, f"Expected {expected_result}, but got {songs}"
 
-    expected_query = normalize_whitespace("""
-        SELECT id, artist, title, year, genre, duration, play_count
-        FROM songs
-        ORDER BY play_count DESC
-    """)
+    expected_query = EXPECTED_ALL_SONGS_BY_PLAY_COUNT_SQL
     actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
 
     assert actual_query == expected_query, "The SQL query did not match the expected structure."
@@ -320,7 +335,7 @@ def test_get_random_song(mock_cursor, mocker):
     # Ensure that the random number was called with the correct number of songs
     mock_random.assert_called_once_with(3)
 
-    expected_query = normalize_whitespace("SELECT id, artist, title, year, genre, duration, play_count FROM songs")
+    expected_query = EXPECTED_ALL_SONGS_SQL
     actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
 
     assert actual_query == expected_query, "The SQL query did not match the expected structure."
@@ -340,7 +355,7 @@ def test_get_random_song_empty_catalog(mock_cursor, mocker):
     # Ensure that the random number was not called since there are no songs
     mock_random.assert_not_called()
 
-    expected_query = normalize_whitespace("SELECT id, artist, title, year, genre, duration, play_count FROM songs ")
+    expected_query = EXPECTED_ALL_SONGS_SQL
     actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
 
     assert actual_query == expected_query, "The SQL query did not match the expected structure."
@@ -362,14 +377,12 @@ def test_update_play_count(mock_cursor):
     song_id = 1
     update_play_count(song_id)
 
-    expected_query = normalize_whitespace("""
-        UPDATE songs SET play_count = play_count + 1 WHERE id = ?
-    """)
-    actual_query = normalize_whitespace(mock_cursor.execute.call_args_list[1][0][0])
+    expected_query = EXPECTED_UPDATE_PLAY_COUNT_SQL
+    update_sql, actual_arguments = mock_cursor.execute.call_args_list[1].args
+    actual_query = normalize_whitespace(update_sql)
 
     assert actual_query == expected_query, "The SQL query did not match the expected structure."
 
-    actual_arguments = mock_cursor.execute.call_args_list[1][0][1]
     expected_arguments = (song_id,)
 
     assert actual_arguments == expected_arguments, f"The SQL query arguments did not match. Expected {expected_arguments}, got {actual_arguments}."
\ No newline at end of file
@@ -1,23 +1,28 @@
-from flask import Flask, jsonify, make_response
+import json
+
+from flask import Flask, Response
 
 app = Flask(__name__)
 
+# Both responses are static, so their JSON bodies are built once at import time
+HELLO_BODY = json.dumps({
+    "message": "Hello World!",
+    "status": "success",
+}).encode()
+
+HEALTH_BODY = json.dumps({
+    "status": "healthy",
+}).encode()
+
 @app.route('/')
 def main():
     app.logger.info("Hello World!")
-    response = {
-        "message": "Hello World!",
-        "status": "success",
-    }
-    return make_response(jsonify(response), 200)
+    return Response(HELLO_BODY, status=200, mimetype="application/json")
 
 @app.route('/health')
 def health_check():
     app.logger.info("Health Check")
-    health_status = {
-        "status": "healthy",
-    }
-    return make_response(jsonify(health_status), 200)
+    return Response(HEALTH_BODY, status=200, mimetype="application/json")
 
 if __name__ == "__main__":
     app.run(host='0.0.0.0', port=5001, debug=True)
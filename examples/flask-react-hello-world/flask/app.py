@@ -1,12 +1,17 @@
-from flask import Flask, jsonify, make_response
+import json
+
+from flask import Flask, Response
 from flask_cors import CORS
 
 app = Flask(__name__)
 CORS(app)  # This will allow the React front-end to communicate with the Flask back-end
 
+# Static body, serialized once at import time
+HELLO_BODY = json.dumps({"message": "Hello, World!"}).encode()
+
 @app.route('/')
 def hello_world():
-    return make_response(jsonify({"message": "Hello, World!"}), 200)
+    return Response(HELLO_BODY, status=200, mimetype="application/json")
 
 if __name__ == '__main__':
     app.run(host="0.0.0.0", debug=True)